@@ -1,17 +1,80 @@
-from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
-from threading import local
 
 
-class ThreadContext(local):
+class _Frame:
     """
-    All context is managed through thread-local data. There is always one active
-    context per thread but additional contexts may be derived from the active
+    A single context on the stack. Each frame holds only the information added
+    by its own context, a reference to its parent frame, and the token needed
+    to restore that parent. Parent data is shared, never copied.
+    """
+
+    __slots__ = ('parent', 'vars', 'token', '_data', '_fragments', '_prefix')
+
+    def merged(self) -> dict:
+        """
+        Merge this frame's information over everything inherited from its
+        ancestors. The result is cached until the frame is mutated; ancestors
+        cannot change while a child is active, so their cached snapshots are
+        reused rather than rebuilt.
+        """
+
+        data = self._data
+
+        if data is None:
+            if self.parent is None:
+                data = dict(self.vars)
+            else:
+                data = dict(self.parent.merged())
+                data.update(self.vars)
+
+            self._data = data
+
+        return data
+
+    def fragments(self) -> dict:
+        """
+        Map each key to its rendered `[key=value]` fragment. Ancestors'
+        fragments are reused, so only keys this frame added or overwrote are
+        re-rendered.
+        """
+
+        fragments = self._fragments
+
+        if fragments is None:
+            parent = self.parent
+            fragments = dict(parent.fragments()) if parent is not None else {}
+
+            for key, value in self.vars.items():
+                fragments[key] = f'[{key}={value}]'
+
+            self._fragments = fragments
+
+        return fragments
+
+
+# The active frame. Context variables are copy-on-write, so every thread and
+# every asyncio task sees its own stack without any locking.
+_frames: ContextVar = ContextVar('backdropy', default=None)
+
+
+class ThreadContext:
+    """
+    All context is managed through a `contextvars.ContextVar`. There is always
+    one active context but additional contexts may be derived from the active
     context. When a child context is created it becomes the active context.
 
     The active context contains its own information, as well as the information
     from all contexts that came before it. Use `Context.data` to access the
-    context instead of `vars(Context)` or `Context.__dict__`.
+    context.
+
+    Because context variables follow the execution context, `push()` and
+    `pop()` in one thread or asyncio task never disturb the stack seen by
+    another. `add()` is different: it mutates the current frame in place, so
+    every execution context sharing that frame (for example a snapshot taken
+    with `contextvars.copy_context()`, or a task spawned before the call)
+    observes the addition too. Push a frame first to keep additions private.
+    The class keeps its historical name for backwards compatibility.
 
     Deleting data is not supported. Create a child context using
     `Context.push()` (or `scope()`) to add temporary context that can be removed
@@ -23,31 +86,35 @@ class ThreadContext(local):
         Create a child context.
         """
 
-        # Add a new context to the stack. The parent context's values are
-        # preserved beneath the child context. The None's will be removed from
-        # the stack when the context is removed, revealing the parent context's
-        # data untouched.
-        for value in vars(self).values():
-            value.append(None)
+        self.push_items(kwargs)
 
-        # Set the values for the new context.
-        self.add(**kwargs)
+    def push_items(self, items):
+        """
+        Create a child context from a mapping or an iterable of `(key, value)`
+        pairs. Positional counterpart to `push()` for hot call sites where the
+        pairs are already built, so nothing is unpacked into keywords.
+        """
+
+        # Frames are never recycled: a popped frame can still be reachable
+        # from a copied execution context (asyncio tasks, copy_context), so
+        # reusing it would leak one context's data into another.
+        frame = _Frame()
+        frame.vars = dict(items)
+        frame.parent = _frames.get()
+        frame._data = None
+        frame._fragments = None
+        frame._prefix = None
+        frame.token = _frames.set(frame)
 
     def pop(self):
         """
         Remove the current context, thus restoring its parent context.
         """
 
-        # Remove the current context from the stack.
-        for key, value in vars(self).items():
-            try:
-                value.pop()
-            except IndexError:
-                pass
-            finally:
-                # There is no need for this attribute anymore.
-                if len(value) == 0:
-                    delattr(self, key)
+        frame = _frames.get()
+
+        if frame is not None:
+            _frames.reset(frame.token)
 
     def add(self, **kwargs):
         """
@@ -55,50 +122,127 @@ class ThreadContext(local):
         collisions occur.
         """
 
-        for key, value in kwargs.items():
-            attr = getattr(self, key, [])
-            attr.append(value)
-            setattr(self, key, attr)
+        self.add_many(kwargs)
 
+    def add_many(self, items):
+        """
+        Add information to the current context from a mapping or an iterable
+        of `(key, value)` pairs. Positional counterpart to `add()` for hot
+        call sites where the pairs are already built, so nothing is unpacked
+        into keywords.
+        """
+
+        frame = _frames.get()
+
+        if frame is None:
+            self.push_items(items)
+        else:
+            frame.vars.update(items)
+            frame._data = None
+            frame._fragments = None
+            frame._prefix = None
+
+    # `_frames.get` is bound at definition time in the two read properties so
+    # the per-log-record hot path uses fast locals instead of global lookups.
     @property
-    def data(self) -> dict:
+    def data(self, _get=_frames.get) -> dict:
         """
         Return all information from the current context.
+
+        The returned mapping is a snapshot cached on the active frame and
+        shared between callers; treat it as read-only and mutate the context
+        through `add()` instead.
+        """
+
+        frame = _get()
+
+        return frame.merged() if frame is not None else {}
+
+    @property
+    def prefix(self, _get=_frames.get) -> str:
         """
+        Return the current context rendered as a `[key=value]...` log prefix.
 
-        data = {}
+        The rendered string is cached on the active frame and recomputed only
+        when the context changes, so reading it on every log record is a
+        single attribute load.
+        """
 
-        for key, value in vars(self).items():
-            compressed = [v for v in value if v]
+        frame = _get()
 
-            if len(compressed) > 0:
-                data[key] = compressed[-1]
+        if frame is None:
+            return ''
 
-        return data
+        if frame._prefix is None:
+            frame._prefix = ''.join(frame.fragments().values())
+
+        return frame._prefix
 
 
 # Initialize the context.
 Context = ThreadContext()
 
 
+# Compiled once at import; each decoration execs it into its own namespace so
+# the wrapper reaches fn/push/pop/vars through that namespace directly instead
+# of through closure cells.
+_WRAPPER = compile(
+    'def wrapper(*args, **kwargs):\n'
+    '    _push_items(_delta)\n'
+    '    try:\n'
+    '        return _fn(*args, **kwargs)\n'
+    '    finally:\n'
+    '        _pop()\n',
+    '<backdropy.contextual>',
+    'exec',
+)
+
+
 def contextual(fn, **vars):
     """
     A decorator that creates a new child context for the callable and removes it
     automatically.
+
+    Decorating without any vars returns the callable unchanged; there is
+    nothing for the wrapper to push, so no wrapper is built.
+    """
+
+    if not vars:
+        return fn
+
+    namespace = {
+        '_fn': fn,
+        '_push_items': Context.push_items,
+        '_pop': Context.pop,
+        '_delta': tuple(vars.items()),
+    }
+    exec(_WRAPPER, namespace)
+
+    return wraps(fn)(namespace['wrapper'])
+
+
+class _Scope:
+    """
+    The context manager returned by `scope()`. A plain class with
+    `__enter__`/`__exit__` avoids the generator frame and
+    `_GeneratorContextManager` object that `contextlib.contextmanager` builds
+    per use.
     """
 
-    @wraps(fn)
-    def decorator(*args, **kwargs):
-        try:
-            Context.push(**vars)
-            return fn(*args, **kwargs)
-        finally:
-            Context.pop()
+    __slots__ = ('vars',)
 
-    return decorator
+    def __init__(self, vars):
+        self.vars = vars
+
+    def __enter__(self):
+        Context.push_items(self.vars)
+
+        return Context
+
+    def __exit__(self, *exc):
+        Context.pop()
 
 
-@contextmanager
 def scope(**vars):
     """
     A context manager that creates a new child context and removes it
@@ -116,8 +260,4 @@ def scope(**vars):
         logger.info('question generated') # [answer=42][name=Ultimate Question][source=Deep Thought] question generated
     """
 
-    try:
-        Context.push(**vars)
-        yield Context
-    finally:
-        Context.pop()
+    return _Scope(vars)
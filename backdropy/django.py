@@ -6,11 +6,11 @@ def contextual(get_response):
     Django middleware.
     """
 
-    def middleware(request):
+    def middleware(request, _push_items=Context.push_items, _pop=Context.pop):
+        _push_items({'request': request})
         try:
-            Context.push(request=request)
             return get_response(request)
         finally:
-            Context.pop()
+            _pop()
 
     return middleware
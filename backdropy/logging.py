@@ -3,16 +3,16 @@ from .context import Context
 
 
 class ContextFilter(logging.Filter):
-    def filter(self, record: logging.LogRecord) -> bool:
-        for key, value in Context.data:
-            setattr(record, key, value)
+    # `_context` is bound at definition time so the per-record hot path loads
+    # it as a fast local instead of a module-level global.
+    def filter(self, record: logging.LogRecord, _context=Context) -> bool:
+        record.__dict__.update(_context.data)
 
         return super().filter(record)
 
 
 class ContextFormatter(logging.Formatter):
-    def format(self, record: logging.LogRecord) -> str:
+    def format(self, record: logging.LogRecord, _context=Context) -> str:
         msg = super().format(record)
-        context = ''.join([f'[{key}={value}]' for key, value in Context.data])
 
-        return f'{context} {msg}'
+        return f'{_context.prefix} {msg}'
@@ -0,0 +1,65 @@
+import unittest
+
+from backdropy import Context, contextual, scope
+
+
+class PushPopTest(unittest.TestCase):
+    def test_pop_restores_the_parent_context(self):
+        Context.push(a=1)
+        self.addCleanup(Context.pop)
+        Context.push(a=2, b=3)
+
+        self.assertEqual(Context.data, {'a': 2, 'b': 3})
+
+        Context.pop()
+
+        self.assertEqual(Context.data, {'a': 1})
+
+    def test_falsy_values_are_retained(self):
+        Context.push(a=0, b='')
+        self.addCleanup(Context.pop)
+
+        self.assertEqual(Context.data, {'a': 0, 'b': ''})
+        self.assertEqual(Context.prefix, '[a=0][b=]')
+
+    def test_add_updates_the_current_context(self):
+        Context.push(a=1)
+        self.addCleanup(Context.pop)
+        Context.add(b=2)
+
+        self.assertEqual(Context.data, {'a': 1, 'b': 2})
+        self.assertEqual(Context.prefix, '[a=1][b=2]')
+
+
+class ScopeTest(unittest.TestCase):
+    def test_scope_removes_its_context_on_exit(self):
+        with scope(answer=42) as ctx:
+            ctx.add(name='Ultimate Question')
+
+            self.assertEqual(Context.data, {'answer': 42, 'name': 'Ultimate Question'})
+
+            with scope(answer=54):
+                self.assertEqual(Context.data, {'answer': 54, 'name': 'Ultimate Question'})
+
+            self.assertEqual(Context.data, {'answer': 42, 'name': 'Ultimate Question'})
+
+        self.assertEqual(Context.data, {})
+
+    def test_scope_removes_its_context_on_error(self):
+        with self.assertRaises(ValueError):
+            with scope(answer=42):
+                raise ValueError
+
+        self.assertEqual(Context.data, {})
+
+
+class ContextualTest(unittest.TestCase):
+    def test_context_exists_only_during_the_call(self):
+        fn = contextual(lambda: dict(Context.data), answer=42)
+
+        self.assertEqual(fn(), {'answer': 42})
+        self.assertEqual(Context.data, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import logging
+import unittest
+
+from backdropy import Context
+from backdropy.logging import ContextFilter, ContextFormatter
+
+
+def record():
+    return logging.LogRecord('test', logging.INFO, 'path', 1, 'message', None, None)
+
+
+class ContextFilterTest(unittest.TestCase):
+    def test_record_gains_the_context_as_attributes(self):
+        Context.push(answer=42, source='Deep Thought')
+        self.addCleanup(Context.pop)
+        rec = record()
+
+        self.assertTrue(ContextFilter().filter(rec))
+        self.assertEqual(rec.answer, 42)
+        self.assertEqual(rec.source, 'Deep Thought')
+
+
+class ContextFormatterTest(unittest.TestCase):
+    def test_message_is_prefixed_with_the_context(self):
+        Context.push(answer=42)
+        self.addCleanup(Context.pop)
+
+        self.assertEqual(ContextFormatter().format(record()), '[answer=42] message')
+
+
+if __name__ == '__main__':
+    unittest.main()